@@ -0,0 +1,417 @@
+"""Benchmark the storefront and admin pages.
+
+Each page is measured two ways: sequentially through the Flask test client
+(no network, shows the cost of the request itself plus its SQL statement
+count) and under concurrent HTTP load against a local server. Seed a
+database first with seed_data.py, then compare commits on the same data:
+
+    export DATABASE_URL=sqlite:///bench.db
+    python benchmark.py --output bench-before.json
+    git checkout <other commit>
+    python benchmark.py --compare bench-before.json
+
+    python benchmark.py --mode http --server gunicorn --workers 4 --concurrency 32
+    python benchmark.py --mode http --url http://127.0.0.1:8000   # an already running server
+    python benchmark.py --pages home product_detail --requests 500
+
+The harness drives the app through page URLs and form posts, and reads its
+fixtures only from tables and columns every commit has (ProductVariant is
+used when the app defines it), so the same script runs against older commits.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from datetime import datetime
+
+from sqlalchemy import event
+
+import app as app_module
+from app import app, db, init_db, Order, Product, User
+
+# (name, session, path); product_detail rotates through sampled product ids
+PAGES = [
+    ('home', 'anonymous', '/'),
+    ('product_detail', 'anonymous', '/product/{product_id}'),
+    ('cart', 'customer', '/cart'),
+    ('checkout', 'customer', '/checkout'),
+    ('my_orders', 'customer', '/my_orders'),
+    ('admin_dashboard', 'admin', '/admin'),
+    ('admin_orders', 'admin', '/admin/orders'),
+    ('admin_products', 'admin', '/admin/products'),
+]
+PAGE_NAMES = [name for name, _, _ in PAGES]
+
+SERVER_SCRIPT = """
+import logging
+import sys
+logging.getLogger('werkzeug').setLevel(logging.WARNING)
+from werkzeug.serving import run_simple
+from app import app, init_db
+init_db()
+run_simple(sys.argv[1], int(sys.argv[2]), app, threaded=True)
+"""
+
+def first_option(value):
+    options = [option.strip() for option in (value or '').split(',') if option.strip()]
+    return options[0] if options else ''
+
+def find_cart_line():
+    """Form fields for a product option with stock to put in the cart"""
+    # Per-variant stock only exists once the app has ProductVariant
+    ProductVariant = getattr(app_module, 'ProductVariant', None)
+    if ProductVariant is not None:
+        variant = (ProductVariant.query.filter(ProductVariant.stock >= 5)
+                   .order_by(ProductVariant.id).first())
+        if variant is not None:
+            return {'product_id': variant.product_id, 'color': variant.color,
+                    'size': variant.size, 'quantity': '1'}
+    else:
+        product = Product.query.filter(Product.stock >= 5).order_by(Product.id).first()
+        if product is not None:
+            return {'product_id': product.id, 'color': first_option(product.colors),
+                    'size': first_option(product.sizes), 'quantity': '1'}
+    raise SystemExit("No product with stock to put in the cart.")
+
+class Fixtures:
+    """Ids and credentials the scenarios need, read once from the database"""
+
+    def __init__(self, args):
+        rng = random.Random(args.seed)
+        with app.app_context():
+            ids = [row[0] for row in db.session.query(Product.id).order_by(Product.id)]
+            if not ids:
+                raise SystemExit("No products in the database. Run seed_data.py first.")
+            self.product_ids = rng.sample(ids, min(len(ids), args.sample_products))
+            self.cart_line = find_cart_line()
+            self.counts = {
+                'products': len(ids),
+                'users': db.session.query(db.func.count(User.id)).scalar(),
+                'orders': db.session.query(db.func.count(Order.id)).scalar(),
+            }
+            self.database = db.engine.url.render_as_string(hide_password=True)
+        self.credentials = {
+            'customer': (args.customer, args.customer_password),
+            'admin': (args.admin, args.admin_password),
+        }
+
+    def path(self, template, n):
+        return template.format(product_id=self.product_ids[n % len(self.product_ids)])
+
+def summarize(mode, page, latencies, errors, elapsed, sql_counts=None):
+    latencies = sorted(latencies)
+
+    def percentile(p):
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, max(0, int(round(p / 100 * len(latencies))) - 1))
+        return round(latencies[index] * 1000, 2)
+
+    result = {
+        'mode': mode,
+        'page': page,
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': percentile(50),
+        'p90_ms': percentile(90),
+        'p99_ms': percentile(99),
+        'sql_per_request': None,
+    }
+    if sql_counts:
+        result['sql_per_request'] = round(sum(sql_counts) / len(sql_counts), 1)
+    return result
+
+# Test client
+def client_session(kind, fixtures):
+    client = app.test_client()
+    if kind == 'anonymous':
+        return client
+    username, password = fixtures.credentials[kind]
+    response = client.post('/login', data={'username': username, 'password': password})
+    if response.status_code != 302:
+        raise SystemExit(f"Could not log in as {username}; check --{kind} and --{kind}-password.")
+    if kind == 'customer':
+        line = fixtures.cart_line
+        client.post(f"/add_to_cart/{line['product_id']}",
+                    data={'color': line['color'], 'size': line['size'], 'quantity': line['quantity']})
+    return client
+
+def run_client(pages, fixtures, args):
+    sessions = {}
+    statements = [0]
+
+    def count_statement(*_):
+        statements[0] += 1
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+    results = []
+    try:
+        for name, kind, template in pages:
+            if kind not in sessions:
+                sessions[kind] = client_session(kind, fixtures)
+            client = sessions[kind]
+            for n in range(args.warmup):
+                client.get(fixtures.path(template, n))
+            latencies, sql_counts, errors = [], [], 0
+            started = time.perf_counter()
+            for n in range(args.requests):
+                path = fixtures.path(template, args.warmup + n)
+                statements[0] = 0
+                request_started = time.perf_counter()
+                response = client.get(path)
+                latencies.append(time.perf_counter() - request_started)
+                sql_counts.append(statements[0])
+                if response.status_code != 200:
+                    errors += 1
+            results.append(summarize('client', name, latencies, errors,
+                                     time.perf_counter() - started, sql_counts))
+            print_result(results[-1])
+    finally:
+        with app.app_context():
+            event.remove(db.engine, 'before_cursor_execute', count_statement)
+    return results
+
+# HTTP load
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(args):
+    port = free_port()
+    if args.server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '--workers', str(args.workers), '--threads', '4',
+                   '--bind', f'127.0.0.1:{port}', '--log-level', 'warning', 'app:app']
+    else:
+        command = [sys.executable, '-c', SERVER_SCRIPT, '127.0.0.1', str(port)]
+    process = subprocess.Popen(command, cwd=os.path.dirname(os.path.abspath(__file__)),
+                               stdout=subprocess.DEVNULL)
+    base_url = f'http://127.0.0.1:{port}'
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"The {args.server} server exited during startup.")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            connection.request('GET', '/login')
+            connection.getresponse().read()
+            return process, base_url
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit(f"The {args.server} server did not start within 60s.")
+
+def http_request(connection, method, path, cookie=None, form=None):
+    headers = {}
+    body = None
+    if cookie:
+        headers['Cookie'] = cookie
+    if form is not None:
+        body = urllib.parse.urlencode(form)
+        headers['Content-Type'] = 'application/x-www-form-urlencoded'
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    return response
+
+def response_cookies(response, cookies):
+    """Merge the response's Set-Cookie headers into a name -> value dict"""
+    for name, header in response.getheaders():
+        if name.lower() == 'set-cookie':
+            cookie_name, _, value = header.split(';', 1)[0].partition('=')
+            cookies[cookie_name.strip()] = value
+    return cookies
+
+def cookie_header(cookies):
+    return '; '.join(f'{name}={value}' for name, value in cookies.items())
+
+def http_session(kind, fixtures, base_url):
+    """Cookie header for a logged-in session; a Flask session survives being replayed"""
+    if kind == 'anonymous':
+        return None
+    url = urllib.parse.urlsplit(base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+    username, password = fixtures.credentials[kind]
+    response = http_request(connection, 'POST', '/login', form={'username': username, 'password': password})
+    cookies = response_cookies(response, {})
+    if response.status != 302 or not cookies:
+        raise SystemExit(f"Could not log in as {username}; check --{kind} and --{kind}-password.")
+    if kind == 'customer':
+        line = fixtures.cart_line
+        response = http_request(connection, 'POST', f"/add_to_cart/{line['product_id']}",
+                                cookie=cookie_header(cookies),
+                                form={'color': line['color'], 'size': line['size'], 'quantity': line['quantity']})
+        # Adding to the cart rewrites the session (cart key, flash message)
+        response_cookies(response, cookies)
+    connection.close()
+    return cookie_header(cookies)
+
+def run_http(pages, fixtures, args, base_url):
+    url = urllib.parse.urlsplit(base_url)
+    sessions = {}
+    results = []
+    for name, kind, template in pages:
+        if kind not in sessions:
+            sessions[kind] = http_session(kind, fixtures, base_url)
+        cookie = sessions[kind]
+        latencies, errors = [], [0]
+        lock = threading.Lock()
+        counter = iter(range(10 ** 9))
+        stop_at = [None]
+
+        def worker():
+            connection = http.client.HTTPConnection(url.hostname, url.port, timeout=60)
+            local, local_errors = [], 0
+            while time.perf_counter() < stop_at[0]:
+                n = next(counter)
+                request_started = time.perf_counter()
+                try:
+                    response = http_request(connection, 'GET', fixtures.path(template, n), cookie=cookie)
+                    ok = response.status == 200
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    ok = False
+                local.append(time.perf_counter() - request_started)
+                if not ok:
+                    local_errors += 1
+            connection.close()
+            with lock:
+                latencies.extend(local)
+                errors[0] += local_errors
+
+        # Warm up caches and connections, then measure for a fixed duration
+        stop_at[0] = time.perf_counter() + args.http_warmup
+        threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        latencies.clear()
+        errors[0] = 0
+
+        started = time.perf_counter()
+        stop_at[0] = started + args.duration
+        threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results.append(summarize('http', name, latencies, errors[0], time.perf_counter() - started))
+        print_result(results[-1])
+    return results
+
+# Reporting
+def print_header():
+    print(f"{'mode':<7} {'page':<16} {'requests':>8} {'errors':>6} {'req/s':>9} "
+          f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'sql/req':>7}")
+
+def print_result(result):
+    def cell(value, width):
+        return f"{'-' if value is None else value:>{width}}"
+    print(f"{result['mode']:<7} {result['page']:<16} {result['requests']:>8} {result['errors']:>6} "
+          f"{result['throughput']:>9} {cell(result['p50_ms'], 8)} {cell(result['p90_ms'], 8)} "
+          f"{cell(result['p99_ms'], 8)} {cell(result['sql_per_request'], 7)}", flush=True)
+
+def git_revision():
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True,
+                               text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+        return revision + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {(r['mode'], r['page']): r for r in baseline['results']}
+    if baseline.get('counts') and baseline['counts'] != results['counts']:
+        print(f"\nWarning: the baseline ran on different data ({baseline['counts']}).")
+    print(f"\nCompared with {baseline.get('revision') or baseline_path}:")
+    print(f"{'mode':<7} {'page':<16} {'req/s':>16} {'p50 ms':>18} {'p99 ms':>18}")
+
+    def change(before, after, higher_is_better):
+        if not before or after is None:
+            return f"{'-':>8}"
+        delta = (after - before) / before * 100
+        return f"{delta:+7.1f}%" + ('' if abs(delta) < 5 else (' better' if (delta > 0) == higher_is_better else ' worse'))
+
+    for result in results['results']:
+        before = previous.get((result['mode'], result['page']))
+        if before is None:
+            continue
+        print(f"{result['mode']:<7} {result['page']:<16} {change(before['throughput'], result['throughput'], True):>16} "
+              f"{change(before['p50_ms'], result['p50_ms'], False):>18} "
+              f"{change(before['p99_ms'], result['p99_ms'], False):>18}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark storefront and admin pages.')
+    parser.add_argument('--mode', choices=['client', 'http', 'both'], default='both')
+    parser.add_argument('--pages', nargs='+', choices=PAGE_NAMES, default=PAGE_NAMES)
+    parser.add_argument('--requests', type=int, default=200, help='test client requests per page')
+    parser.add_argument('--warmup', type=int, default=20, help='test client warm-up requests per page')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent HTTP connections')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds of HTTP load per page')
+    parser.add_argument('--http-warmup', type=float, default=2.0, help='seconds of HTTP warm-up per page')
+    parser.add_argument('--url', help='benchmark a running server instead of starting one')
+    parser.add_argument('--server', choices=['werkzeug', 'gunicorn'], default='werkzeug')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn worker processes')
+    parser.add_argument('--customer', default='seed-user-1')
+    parser.add_argument('--customer-password', default='benchmark')
+    parser.add_argument('--admin', default='admin')
+    parser.add_argument('--admin-password', default='rosstech')
+    parser.add_argument('--sample-products', type=int, default=1000, help='distinct products product_detail visits')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', help='JSON results from an earlier run to compare against')
+    args = parser.parse_args()
+
+    init_db()
+    fixtures = Fixtures(args)
+    pages = [page for page in PAGES if page[0] in args.pages]
+    print(f"Database: {fixtures.database} ({', '.join(f'{v:,} {k}' for k, v in fixtures.counts.items())})")
+    print_header()
+
+    results = []
+    if args.mode in ('client', 'both'):
+        results += run_client(pages, fixtures, args)
+    if args.mode in ('http', 'both'):
+        process = None
+        base_url = args.url
+        if not base_url:
+            process, base_url = start_server(args)
+        try:
+            results += run_http(pages, fixtures, args, base_url)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    report = {
+        'revision': git_revision(),
+        'created_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        'database': fixtures.database,
+        'counts': fixtures.counts,
+        'settings': {key: getattr(args, key) for key in
+                     ('requests', 'warmup', 'concurrency', 'duration', 'server', 'workers', 'seed')},
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+    if args.compare:
+        print_comparison(report, args.compare)
+
+if __name__ == '__main__':
+    main()
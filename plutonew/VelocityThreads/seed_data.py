@@ -0,0 +1,240 @@
+"""Fill the database with a large, deterministic synthetic catalog for load testing.
+
+Run it against an empty database so benchmark numbers are comparable:
+
+    DATABASE_URL=sqlite:///bench.db python seed_data.py
+    DATABASE_URL=sqlite:///bench.db python seed_data.py --products 5000 --users 10000 --orders 100000
+
+The same --seed always produces the same rows. Every seeded user can log in
+with the password "benchmark" (seed-user-1, seed-user-2, ...).
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from werkzeug.security import generate_password_hash
+
+from app import (app, db, init_db, reconcile_store_stats, Order, OrderItem, Product,
+                 ProductImage, ProductVariant, User)
+
+SEED_PASSWORD = 'benchmark'
+SEED_EPOCH = datetime(2024, 1, 1)
+
+CATALOG = {
+    'clothing': ['shirts', 'tshirts', 'pants', 'jeans', 'jackets', 'hoodies'],
+    'accessories': ['caps', 'watches', 'bags', 'sunglasses'],
+    'footwear': ['shoes'],
+    'sports': ['tshirts', 'jackets', 'caps'],
+}
+COLORS = ['Red', 'Black', 'White', 'Blue', 'Grey', 'Green', 'Yellow', 'Orange']
+SIZES = ['XS', 'S', 'M', 'L', 'XL', 'XXL']
+ADJECTIVES = ['Apex', 'Pit Lane', 'Grid', 'Podium', 'Slipstream', 'Chicane', 'Pole', 'Paddock', 'Turbo', 'Downforce']
+NOUNS = {
+    'shirts': 'Shirt', 'tshirts': 'Tee', 'pants': 'Track Pants', 'jeans': 'Jeans', 'jackets': 'Jacket',
+    'hoodies': 'Hoodie', 'caps': 'Cap', 'watches': 'Chrono Watch', 'bags': 'Kit Bag',
+    'sunglasses': 'Shades', 'shoes': 'Sneakers',
+}
+STATUSES = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
+STATUS_WEIGHTS = [15, 10, 15, 55, 5]
+# Seeded products share a copy of a bundled picture under static/images/products,
+# so the site's own images are never one of their files. Product deletes only
+# unlink a file once no remaining product references it
+SEED_IMAGE_SOURCE = os.path.join('images', 'hero-banner.jpeg')
+SEED_IMAGE = '/static/images/products/seed-product.jpeg'
+
+def ensure_seed_image():
+    target = os.path.join(app.static_folder, 'images', 'products', 'seed-product.jpeg')
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(os.path.join(app.static_folder, SEED_IMAGE_SOURCE), target)
+
+def next_id(model):
+    """First free primary key, so batches can reference rows before they are read back"""
+    return (db.session.query(db.func.max(model.id)).scalar() or 0) + 1
+
+def insert_batches(model, rows, batch_size):
+    batch = []
+    count = 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.session.bulk_insert_mappings(model, batch)
+            db.session.commit()
+            count += len(batch)
+            batch = []
+    if batch:
+        db.session.bulk_insert_mappings(model, batch)
+        db.session.commit()
+        count += len(batch)
+    return count
+
+def progress(label, started, count):
+    print(f"  {label}: {count:,} rows in {time.perf_counter() - started:.1f}s")
+
+def seed_users(rng, count, batch_size):
+    # Hashing is deliberately slow, so every seeded user shares one hash
+    password_hash = generate_password_hash(SEED_PASSWORD)
+    first_id = next_id(User)
+
+    def rows():
+        for n in range(count):
+            user_id = first_id + n
+            yield {
+                'id': user_id,
+                'username': f'seed-user-{n + 1}',
+                'email': f'seed-user-{n + 1}@example.com',
+                'password_hash': password_hash,
+                'is_admin': False,
+                'created_at': SEED_EPOCH + timedelta(minutes=rng.randrange(365 * 24 * 60)),
+            }
+
+    started = time.perf_counter()
+    progress('users', started, insert_batches(User, rows(), batch_size))
+    return list(range(first_id, first_id + count))
+
+def seed_products(rng, count, batch_size):
+    """Products with colors/sizes, one variant per combination and 1-3 images"""
+    first_product_id = next_id(Product)
+    first_variant_id = next_id(ProductVariant)
+    products, variants, images = [], [], []
+    catalog = []  # (product_id, price, [(variant_id, color, size)])
+    variant_id = first_variant_id
+    categories = list(CATALOG)
+    for n in range(count):
+        product_id = first_product_id + n
+        category = rng.choice(categories)
+        subcategory = rng.choice(CATALOG[category])
+        colors = rng.sample(COLORS, rng.randint(1, 4)) if rng.random() < 0.9 else []
+        sizes = rng.sample(SIZES, rng.randint(2, 5)) if category in ('clothing', 'sports', 'footwear') else []
+        price = round(rng.uniform(199, 4999), 2)
+        product_variants = []
+        for color in colors or ['']:
+            for size in sizes or ['']:
+                stock = rng.choice([0, 2, 5, 8, 15, 25, 40, 80])
+                variants.append({'id': variant_id, 'product_id': product_id, 'color': color, 'size': size, 'stock': stock})
+                product_variants.append((variant_id, color, size, stock))
+                variant_id += 1
+        products.append({
+            'id': product_id,
+            'sku': f'SEED-{product_id:07d}',
+            'name': f'{rng.choice(ADJECTIVES)} {NOUNS[subcategory]} {product_id}',
+            'description': (f'Race-inspired {NOUNS[subcategory].lower()} in the {category} range. '
+                            f'Breathable fabric, paddock-ready fit and team-colour details. Style #{product_id}.'),
+            'price': price,
+            'image_url': SEED_IMAGE,
+            'category': category,
+            'subcategory': subcategory,
+            'stock': sum(stock for _, _, _, stock in product_variants),
+            'colors': ', '.join(colors),
+            'sizes': ', '.join(sizes),
+            'created_at': SEED_EPOCH + timedelta(minutes=n),
+        })
+        for _ in range(rng.randint(1, 3)):
+            images.append({'product_id': product_id, 'image_path': SEED_IMAGE, 'created_at': SEED_EPOCH})
+        catalog.append((product_id, price, [(v_id, color, size) for v_id, color, size, _ in product_variants]))
+
+    started = time.perf_counter()
+    progress('products', started, insert_batches(Product, products, batch_size))
+    started = time.perf_counter()
+    progress('product variants', started, insert_batches(ProductVariant, variants, batch_size))
+    started = time.perf_counter()
+    progress('product images', started, insert_batches(ProductImage, images, batch_size))
+    return catalog
+
+def seed_orders(rng, count, user_ids, catalog, batch_size):
+    """Orders spread over a year, each with 1-4 items priced from the catalog"""
+    first_order_id = next_id(Order)
+    first_item_id = next_id(OrderItem)
+    # A few hundred popular products take most of the orders, as in a real shop
+    popular = catalog[:max(1, len(catalog) // 100)]
+    order_rows, item_rows = [], []
+    order_count = item_count = 0
+    item_id = first_item_id
+    started = time.perf_counter()
+    for n in range(count):
+        order_id = first_order_id + n
+        total = 0.0
+        for _ in range(rng.choices([1, 2, 3, 4], weights=[50, 30, 15, 5])[0]):
+            product_id, price, product_variants = rng.choice(popular if rng.random() < 0.4 else catalog)
+            variant_id, color, size = rng.choice(product_variants)
+            quantity = rng.choices([1, 2, 3], weights=[80, 15, 5])[0]
+            total += price * quantity
+            item_rows.append({
+                'id': item_id, 'order_id': order_id, 'product_id': product_id, 'quantity': quantity,
+                'price': price, 'selected_color': color or None, 'selected_size': size or None,
+                'variant_id': variant_id,
+            })
+            item_id += 1
+        advance = 100.0
+        has_utr = rng.random() < 0.7
+        order_rows.append({
+            'id': order_id,
+            'order_number': f'SEED-{order_id:09d}',
+            'user_id': rng.choice(user_ids),
+            'total_amount': round(total, 2),
+            'advance_paid': advance,
+            'remaining_amount': round(total - advance, 2),
+            'status': rng.choices(STATUSES, weights=STATUS_WEIGHTS)[0],
+            'shipping_address': f'{rng.randint(1, 999)} Circuit Road, Sector {rng.randint(1, 99)}, Mumbai 4000{rng.randint(10, 99)}',
+            'phone': f'9{rng.randrange(10 ** 9):09d}',
+            'utr_number': f'{rng.randrange(10 ** 12):012d}' if has_utr else '',
+            'payment_screenshot': None,
+            'created_at': SEED_EPOCH + timedelta(seconds=n * 31536000 // max(count, 1)),
+        })
+        if len(order_rows) >= batch_size:
+            db.session.bulk_insert_mappings(Order, order_rows)
+            db.session.bulk_insert_mappings(OrderItem, item_rows)
+            db.session.commit()
+            order_count += len(order_rows)
+            item_count += len(item_rows)
+            order_rows, item_rows = [], []
+            if order_count % (batch_size * 20) == 0:
+                progress('orders so far', started, order_count)
+    if order_rows:
+        db.session.bulk_insert_mappings(Order, order_rows)
+        db.session.bulk_insert_mappings(OrderItem, item_rows)
+        db.session.commit()
+        order_count += len(order_rows)
+        item_count += len(item_rows)
+    progress('orders', started, order_count)
+    print(f"  order items: {item_count:,} rows")
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed the database with synthetic products, users and orders.')
+    parser.add_argument('--products', type=int, default=50000)
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--orders', type=int, default=1000000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=42, help='random seed; the same seed gives the same data')
+    parser.add_argument('--force', action='store_true', help='seed even if the database already has products')
+    args = parser.parse_args()
+
+    init_db()
+    with app.app_context():
+        print(f"Seeding {db.engine.url.render_as_string(hide_password=True)}")
+        if Product.query.first() is not None and not args.force:
+            print("The database already has products. Point DATABASE_URL at an empty database "
+                  "or pass --force to add to it.")
+            return 1
+        rng = random.Random(args.seed)
+        ensure_seed_image()
+        started = time.perf_counter()
+        user_ids = seed_users(rng, args.users, args.batch_size)
+        catalog = seed_products(rng, args.products, args.batch_size)
+        if args.orders and user_ids and catalog:
+            seed_orders(rng, args.orders, user_ids, catalog, args.batch_size)
+        # The dashboard counters are maintained incrementally; bulk inserts bypass them
+        reconcile_store_stats()
+        if db.engine.dialect.name == 'sqlite':
+            db.session.execute(text('ANALYZE'))
+            db.session.commit()
+        print(f"Done in {time.perf_counter() - started:.1f}s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
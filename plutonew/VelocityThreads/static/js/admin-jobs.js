@@ -0,0 +1,46 @@
+// Poll a background maintenance job and show its progress
+document.addEventListener('DOMContentLoaded', function() {
+    const panel = document.getElementById('jobProgress');
+    if (!panel) {
+        return;
+    }
+
+    const bar = panel.querySelector('.progress-bar');
+    const label = panel.querySelector('.job-message');
+
+    function render(job) {
+        const percent = job.total ? Math.round(job.progress * 100 / job.total) : (job.status === 'done' ? 100 : 0);
+        bar.style.width = percent + '%';
+        bar.textContent = job.total ? job.progress + ' / ' + job.total : '';
+
+        if (job.status === 'done' || job.status === 'failed') {
+            bar.classList.remove('progress-bar-animated', 'progress-bar-striped');
+            bar.classList.add(job.status === 'done' ? 'bg-success' : 'bg-danger');
+            label.textContent = job.message || (job.status === 'done' ? 'Finished.' : 'Failed.');
+            if (job.status === 'done') {
+                const reload = document.createElement('a');
+                reload.href = window.location.pathname;
+                reload.className = 'ms-2';
+                reload.textContent = 'Refresh list';
+                label.appendChild(reload);
+            }
+            return false;
+        }
+
+        label.textContent = job.status === 'queued' ? 'Waiting to start...' : 'Working...';
+        return true;
+    }
+
+    function poll() {
+        fetch(panel.dataset.statusUrl, { headers: { 'Accept': 'application/json' } })
+            .then(response => response.json())
+            .then(job => {
+                if (render(job)) {
+                    setTimeout(poll, 1000);
+                }
+            })
+            .catch(() => setTimeout(poll, 3000));
+    }
+
+    poll();
+});
@@ -0,0 +1,123 @@
+// Lazy loading optimization
+document.addEventListener('DOMContentLoaded', function() {
+    const images = document.querySelectorAll('.product-image');
+    images.forEach(img => {
+        if (img.complete) {
+            img.classList.add('loaded');
+        } else {
+            img.addEventListener('load', function() {
+                this.classList.add('loaded');
+            });
+        }
+    });
+
+    // Hero image handling
+    const heroImage = document.querySelector('.hero-image');
+    if (heroImage) {
+        const img = new Image();
+        img.onload = function() {
+            console.log('Hero image loaded successfully');
+        };
+        img.onerror = function() {
+            console.log('Hero image failed to load');
+        };
+        img.src = heroImage.currentSrc || heroImage.src;
+    }
+
+    // Smooth scroll for anchor links
+    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+        anchor.addEventListener('click', function (e) {
+            e.preventDefault();
+            const target = document.querySelector(this.getAttribute('href'));
+            if (target) {
+                target.scrollIntoView({
+                    behavior: 'smooth',
+                    block: 'start'
+                });
+            }
+        });
+    });
+
+    // Search and Filter Functionality
+    // Filtering happens on the server: each control rewrites the query
+    // string and reloads the first page of matching products.
+    const searchInput = document.getElementById('searchInput');
+    const searchBtn = document.getElementById('searchBtn');
+    const inStockFilter = document.getElementById('inStockFilter');
+    const params = new URLSearchParams(window.location.search);
+
+    function applyFilters(updates) {
+        Object.keys(updates).forEach(key => {
+            const value = updates[key];
+            if (value === '' || value === 'all' || value === null) {
+                params.delete(key);
+            } else {
+                params.set(key, value);
+            }
+        });
+        // Any filter change starts again from the first page
+        params.delete('cursor');
+        const query = params.toString();
+        window.location.href = window.location.pathname + (query ? '?' + query : '') + '#products';
+    }
+
+    // Reflect the active filters in the dropdown labels
+    function markActive(selector, attr, value, buttonId) {
+        document.querySelectorAll(selector).forEach(item => {
+            if (value && item.getAttribute(attr).toLowerCase() === value.toLowerCase()) {
+                document.getElementById(buttonId).textContent = item.textContent;
+            }
+        });
+    }
+    markActive('[data-category]', 'data-category', params.get('category'), 'categoryFilter');
+    markActive('[data-subcategory]', 'data-subcategory', params.get('subcategory'), 'subcategoryFilter');
+    document.querySelectorAll('[data-price]').forEach(item => {
+        if ((params.get('min_price') || params.get('max_price')) &&
+            item.getAttribute('data-min') === (params.get('min_price') || '') &&
+            item.getAttribute('data-max') === (params.get('max_price') || '')) {
+            document.getElementById('priceFilter').textContent = item.textContent;
+        }
+    });
+
+    // Search functionality
+    searchBtn.addEventListener('click', function() {
+        applyFilters({ q: searchInput.value.trim() });
+    });
+    searchInput.addEventListener('keyup', function(e) {
+        if (e.key === 'Enter') {
+            applyFilters({ q: searchInput.value.trim() });
+        }
+    });
+
+    // Category filter
+    document.querySelectorAll('[data-category]').forEach(item => {
+        item.addEventListener('click', function(e) {
+            e.preventDefault();
+            applyFilters({ category: this.getAttribute('data-category') });
+        });
+    });
+
+    // Subcategory filter
+    document.querySelectorAll('[data-subcategory]').forEach(item => {
+        item.addEventListener('click', function(e) {
+            e.preventDefault();
+            applyFilters({ subcategory: this.getAttribute('data-subcategory') });
+        });
+    });
+
+    // Price filter
+    document.querySelectorAll('[data-price]').forEach(item => {
+        item.addEventListener('click', function(e) {
+            e.preventDefault();
+            applyFilters({
+                min_price: this.getAttribute('data-min'),
+                max_price: this.getAttribute('data-max')
+            });
+        });
+    });
+
+    // Stock filter
+    inStockFilter.addEventListener('change', function() {
+        applyFilters({ in_stock: this.checked ? '1' : '' });
+    });
+});